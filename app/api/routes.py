@@ -1,34 +1,62 @@
 """API routes"""
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import HTMLResponse
+import hmac
+import logging
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 
 from app.models import (
     QueryRequest,
     QueryResponse,
     HealthResponse,
-    StatsResponse,
-    ContextItem
+    StatsResponse
 )
 from app.services import chatbot_service
 from app.core.config import settings
+from app.utils.http import cached_response, make_etag
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def require_ready():
+    """Dependency that rejects requests until the chatbot service is initialized"""
+    if not chatbot_service.is_ready:
+        raise HTTPException(status_code=503, detail="Chatbot not initialized")
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Dependency that only admits requests carrying the configured ADMIN_TOKEN"""
+    # Without a configured token the endpoint doesn't exist as far as clients can tell
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+# Serialized /health bodies keyed by readiness; there are only two possible answers
+_health_bodies = {}
+
+
 @router.get("/", response_class=HTMLResponse, tags=["Frontend"])
-async def home():
-    """Serve the main HTML page"""
-    try:
-        with open("templates/index.html", "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
+async def home(request: Request):
+    """Serve the main HTML page (loaded into memory at startup)"""
+    index_html = getattr(request.app.state, "index_html", None)
+    if index_html is None:
         return HTMLResponse(
             content="<h1>Template not found</h1><p>Please ensure templates/index.html exists</p>",
             status_code=404
         )
+    
+    return cached_response(
+        request, index_html, request.app.state.index_etag, max_age=3600, media_type="text/html"
+    )
 
 
-@router.post("/query", response_model=QueryResponse, tags=["Chatbot"])
+@router.post("/query", response_model=QueryResponse, tags=["Chatbot"], dependencies=[Depends(require_ready)])
 async def query(request: QueryRequest):
     """
     Query the chatbot with a question
@@ -36,90 +64,108 @@ async def query(request: QueryRequest):
     - **question**: The user's question
     - **top_k**: Number of similar documents to retrieve (default: 5)
     """
-    print("\n" + "="*60)
-    print("🌐 DEBUG: Received POST /query request")
-    print(f"   Question: {request.question}")
-    print(f"   Top K: {request.top_k}")
-    print("="*60)
-    
-    if not chatbot_service.is_ready:
-        print("❌ DEBUG: Chatbot service not ready!")
-        raise HTTPException(status_code=503, detail="Chatbot not initialized")
+    logger.debug("query q=%r top_k=%s", request.question, request.top_k)
     
     try:
-        print("🔄 DEBUG: Calling chatbot service...")
         result = await chatbot_service.query(
             request.question,
-            top_k=request.top_k
-        )
-        
-        print(f"✅ DEBUG: Query successful, building response...")
-        response = QueryResponse(
-            answer=result['answer'],
-            context=[ContextItem(**item) for item in result.get('context', [])],
-            question=result['question']
+            top_k=request.top_k,
+            use_cache=not request.no_cache
         )
-        print(f"📤 DEBUG: Sending response ({len(response.answer)} chars)")
-        return response
-        
     except Exception as e:
-        print(f"❌ DEBUG: Error in query endpoint: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("query failed")
         raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
+    
+    # Return the service result as-is: it already matches QueryResponse, so
+    # skip building per-item ContextItem models just to serialize them again
+    return ORJSONResponse(content={
+        "answer": result['answer'],
+        "context": result.get('context', []),
+        "question": result['question']
+    })
+
+
+@router.post("/query/stream", tags=["Chatbot"], dependencies=[Depends(require_ready)])
+async def query_stream(request: QueryRequest):
+    """
+    Query the chatbot and stream the answer as Server-Sent Events
+    
+    Emits one `context` event with the retrieved documents, then `token`
+    events with answer text as the LLM produces it, then a final `done` event.
+    """
+    logger.debug("query stream q=%r top_k=%s", request.question, request.top_k)
+    
+    async def event_stream():
+        try:
+            async for event, data in chatbot_service.query_stream(request.question, top_k=request.top_k):
+                payload = {"context": data} if event == "context" else {"text": data}
+                yield f"event: {event}\ndata: {orjson.dumps(payload).decode()}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        except Exception as e:
+            logger.exception("query stream failed")
+            yield f"event: error\ndata: {orjson.dumps({'detail': str(e)}).decode()}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/health", response_model=HealthResponse, tags=["System"])
-async def health():
+async def health(request: Request):
     """Health check endpoint"""
-    print("🏥 DEBUG: Health check requested")
     is_ready = chatbot_service.is_ready
-    status = "healthy" if is_ready else "initializing"
-    print(f"   Status: {status}")
-    print(f"   Ready: {is_ready}")
     
-    return HealthResponse(
-        status=status,
-        chatbot_ready=is_ready,
-        version=settings.APP_VERSION
-    )
+    if is_ready not in _health_bodies:
+        body = orjson.dumps(HealthResponse(
+            status="healthy" if is_ready else "initializing",
+            chatbot_ready=is_ready,
+            version=settings.APP_VERSION
+        ).model_dump())
+        _health_bodies[is_ready] = (body, make_etag(body))
+    
+    body, etag = _health_bodies[is_ready]
+    return cached_response(request, body, etag, max_age=5, media_type="application/json")
 
 
-@router.get("/stats", response_model=StatsResponse, tags=["System"])
+@router.get("/stats", response_model=StatsResponse, tags=["System"], dependencies=[Depends(require_ready)])
 async def stats():
     """Get chatbot statistics"""
-    print("📊 DEBUG: Stats endpoint requested")
-    
-    if not chatbot_service.is_ready:
-        print("❌ DEBUG: Chatbot not ready for stats")
-        raise HTTPException(status_code=503, detail="Chatbot not initialized")
-    
     try:
-        print("🔄 DEBUG: Getting stats from service...")
-        stats_data = chatbot_service.get_stats()
-        print(f"✅ DEBUG: Stats retrieved successfully")
+        stats_data = await chatbot_service.get_stats()
         return StatsResponse(**stats_data)
     except Exception as e:
-        print(f"❌ DEBUG: Error getting stats: {e}")
+        logger.exception("stats failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cache/stats", tags=["System"])
+async def cache_stats():
+    """Get embedding and response cache statistics"""
+    return chatbot_service.get_cache_stats()
+
+
+@router.post("/cache/clear", tags=["System"], dependencies=[Depends(require_admin)])
+async def cache_clear():
+    """Clear the embedding and response caches"""
+    chatbot_service.clear_caches()
+    return {"status": "cleared"}
+
+
 @router.get("/config", tags=["System"])
-async def get_config():
+async def get_config(request: Request):
     """
     Get current configuration settings
     This allows frontend to use backend configuration dynamically
     """
-    return {
-        "top_k": settings.TOP_K,
-        "max_tokens": settings.MAX_TOKENS,
-        "temperature": settings.TEMPERATURE,
-        "similarity_threshold": settings.SIMILARITY_THRESHOLD,
-        "llm_provider": settings.LLM_PROVIDER,
-        "model": settings.OPENAI_MODEL if settings.LLM_PROVIDER == "openai" else settings.HUGGINGFACE_MODEL,
-        "embedding_model": settings.EMBEDDING_MODEL,
-        "collection_name": settings.COLLECTION_NAME
-    }
+    return cached_response(
+        request,
+        request.app.state.config_payload,
+        request.app.state.config_etag,
+        max_age=300,
+        media_type="application/json"
+    )
 
 
 @router.get("/debug/versions", tags=["Debug"])
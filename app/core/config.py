@@ -4,6 +4,16 @@ from pydantic_settings import BaseSettings
 from typing import Optional
 
 
+# Output dimensions of known FastEmbed models, so startup can skip a probe embedding
+EMBEDDING_DIMS = {
+    "BAAI/bge-small-en-v1.5": 384,
+    "BAAI/bge-base-en-v1.5": 768,
+    "BAAI/bge-large-en-v1.5": 1024,
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "nomic-ai/nomic-embed-text-v1.5": 768,
+}
+
+
 class Settings(BaseSettings):
     """Application settings"""
     
@@ -47,13 +57,39 @@ class Settings(BaseSettings):
     TOP_K: int = 10
     SIMILARITY_THRESHOLD: float = 0.3
     
+    # Batching Settings (concurrent queries share one embed call and one Qdrant request)
+    BATCH_WINDOW_MS: float = 5  # How long to wait for more queries before dispatching
+    MAX_BATCH_SIZE: int = 32  # Dispatch immediately once this many queries are queued
+    
+    # Cache Settings
+    EMBEDDING_CACHE_SIZE: int = 1024  # Query embeddings kept in memory (0 disables)
+    RESPONSE_CACHE_SIZE: int = 512  # Full query responses kept in memory (0 disables)
+    RESPONSE_CACHE_TTL: int = 3600  # Seconds before a cached response expires
+    # Semantic retrieval cache: reuses Qdrant results for questions whose embeddings
+    # land in the same LSH bucket. Off by default since distinct questions can collide
+    ENABLE_SEM_CACHE: bool = False
+    SEM_CACHE_BITS: int = 16  # Random-projection bits per bucket (more bits = fewer collisions)
+    SEM_CACHE_SIZE: int = 1024
+    
+    # Admin token for maintenance endpoints such as POST /cache/clear,
+    # sent as the X-Admin-Token header (unset disables those endpoints)
+    ADMIN_TOKEN: Optional[str] = None
+    
     # Qdrant Settings
     QDRANT_URL: Optional[str] = None  # e.g., "https://xyz.cloud.qdrant.io"
     QDRANT_API_KEY: Optional[str] = None
     COLLECTION_NAME: str = "instructions"
+    UPLOAD_BATCH_SIZE: int = 256  # Points per upsert when populating the collection
+    UPLOAD_PARALLEL: int = 4  # Concurrent upload workers when populating the collection
+    COMPACT_PAYLOAD: bool = True  # New collections store only the source; text is served from DATA_PATH
     
     # Embedding Model (FastEmbed)
     EMBEDDING_MODEL: str = "BAAI/bge-small-en-v1.5"
+    EMBED_THREADS: Optional[int] = None  # ONNX intra-op threads (None = all cores)
+    EMBED_BATCH_SIZE: int = 64  # Texts per ONNX forward pass
+    EMBED_PARALLEL: Optional[int] = None  # Worker processes for bulk populate (0 = all cores)
+    EMBEDDING_DEVICE: str = "cpu"  # "cuda" embeds the bulk populate on GPU (needs fastembed-gpu)
+    EMBEDDING_CACHE_DIR: Optional[str] = "cache"  # FP16 document embeddings reused across restarts (None disables)
     
     # Data Settings
     DATA_PATH: str = "data/data.json"
@@ -70,6 +106,19 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = True
+    
+    def public_config(self) -> dict:
+        """Settings exposed to the frontend via /config"""
+        return {
+            "top_k": self.TOP_K,
+            "max_tokens": self.MAX_TOKENS,
+            "temperature": self.TEMPERATURE,
+            "similarity_threshold": self.SIMILARITY_THRESHOLD,
+            "llm_provider": self.LLM_PROVIDER,
+            "model": self.OPENAI_MODEL if self.LLM_PROVIDER == "openai" else self.HUGGINGFACE_MODEL,
+            "embedding_model": self.EMBEDDING_MODEL,
+            "collection_name": self.COLLECTION_NAME
+        }
 
 
 # Global settings instance
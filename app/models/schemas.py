@@ -1,20 +1,26 @@
 """Pydantic models for request/response validation"""
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Any, Dict, List, Optional
 from app.core.config import settings
 
 
 class ContextItem(BaseModel):
     """Context item from retrieval"""
+    model_config = ConfigDict(extra='ignore')
+    
     instruction: str
     output: str
     similarity: float
+    channel_username: Optional[str] = None
+    video_id: Optional[str] = None
+    source: Optional[str] = None
 
 
 class QueryRequest(BaseModel):
     """Query request model"""
     question: str = Field(..., min_length=1, description="User's question")
     top_k: Optional[int] = Field(None, ge=1, le=20, description="Number of documents to retrieve")
+    no_cache: bool = Field(False, description="Bypass the response cache for this request")
     
     @field_validator('top_k', mode='before')
     @classmethod
@@ -44,3 +50,4 @@ class StatsResponse(BaseModel):
     embedding_model: str
     max_tokens: int
     default_top_k: int
+    embedding_cache: Optional[Dict[str, Any]] = None
@@ -1,22 +1,88 @@
 """Chatbot service with RAG implementation using Qdrant Cloud"""
+import asyncio
+import hashlib
 import json
-from typing import List, Dict, Any
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+import logging
+import os
+from typing import List, Dict, Any, AsyncIterator, Hashable, Iterator, Tuple
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import Distance, VectorParams, PointStruct, QueryRequest
 from fastembed.embedding import DefaultEmbedding
 
-from app.core.config import settings
+from app.core.config import settings, EMBEDDING_DIMS
 from app.services.llm_provider import get_llm_provider, LLMProvider
+from app.utils.batching import MicroBatcher
+from app.utils.cache import LRUCache, TTLCache
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = "You are a helpful assistant that answers questions based on provided context."
+NO_CONTEXT_ANSWER = "I couldn't find relevant information to answer your question."
+
+# Static parts of the RAG prompt; the context and question are spliced in between
+_PROMPT_HEAD = """You are a knowledgeable assistant. Answer the user's question based on the following relevant information from the knowledge base.
+
+Relevant Information:
+"""
+_PROMPT_MID = """
+
+User Question: """
+_PROMPT_TAIL = """
+
+Instructions:
+- Answer based on the provided information and context only
+- Provide comprehensive, detailed responses when the question requires it
+- If the information doesn't fully answer the question, say so
+- Synthesize information from multiple sources when relevant
+- Maintain the tone and style of the knowledge base
+- Use examples and explanations where helpful
+- Never give any reference from quran
+
+Answer:"""
 
 
 class ChatbotService:
     """RAG Chatbot Service with Qdrant Cloud"""
     
+    __slots__ = (
+        'data', 'llm_provider', 'qdrant_client', 'async_qdrant_client', 'embedding_model',
+        '_embedding_cache', '_response_cache', '_semantic_cache', '_projection', '_inflight', '_embed_batcher', '_search_batcher',
+        '_collection', '_threshold', '_top_k', '_compact_payload', '_data_digest', '_initialized'
+    )
+    
     def __init__(self):
         self.data: List[Dict[str, str]] = []
         self.llm_provider: LLMProvider = None
         self.qdrant_client: QdrantClient = None
+        self.async_qdrant_client: AsyncQdrantClient = None
         self.embedding_model: DefaultEmbedding = None
+        self._embedding_cache = LRUCache(maxsize=settings.EMBEDDING_CACHE_SIZE)
+        self._response_cache = TTLCache(
+            maxsize=settings.RESPONSE_CACHE_SIZE,
+            ttl=settings.RESPONSE_CACHE_TTL
+        )
+        self._semantic_cache = LRUCache(maxsize=settings.SEM_CACHE_SIZE)
+        self._projection: np.ndarray = None
+        self._inflight: Dict[Hashable, asyncio.Lock] = {}
+        self._embed_batcher = MicroBatcher(
+            self._embed_batch,
+            max_batch_size=settings.MAX_BATCH_SIZE,
+            window_ms=settings.BATCH_WINDOW_MS
+        )
+        self._search_batcher = MicroBatcher(
+            self._search_batch,
+            max_batch_size=settings.MAX_BATCH_SIZE,
+            window_ms=settings.BATCH_WINDOW_MS
+        )
+        
+        # Settings read on every query, bound once to avoid repeated lookups
+        self._collection = settings.COLLECTION_NAME
+        self._threshold = settings.SIMILARITY_THRESHOLD
+        self._top_k = settings.TOP_K
+        self._compact_payload = settings.COMPACT_PAYLOAD
+        self._data_digest: str = None
         self._initialized = False
     
     async def initialize(self):
@@ -24,11 +90,14 @@ class ChatbotService:
         if self._initialized:
             return
         
-        print("Loading data...")
-        with open(settings.DATA_PATH, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        logger.info("Loading data...")
+        with open(settings.DATA_PATH, 'rb') as f:
+            raw = f.read()
+        self.data = json.loads(raw)
+        # Fingerprint of the data file; compact collections are tied to it
+        self._data_digest = hashlib.sha256(raw).hexdigest()[:16]
         
-        print(f"Initializing LLM provider: {settings.LLM_PROVIDER}...")
+        logger.info("Initializing LLM provider: %s...", settings.LLM_PROVIDER)
         self.llm_provider = get_llm_provider(
             provider_name=settings.LLM_PROVIDER,
             openai_key=settings.OPENAI_API_KEY,
@@ -42,22 +111,40 @@ class ChatbotService:
         if not self.llm_provider.is_available():
             raise ValueError(f"LLM provider '{settings.LLM_PROVIDER}' is not properly configured. Check your API keys.")
         
-        print("Initializing Qdrant client...")
+        logger.info("Initializing Qdrant client...")
         if not settings.QDRANT_URL or not settings.QDRANT_API_KEY:
             raise ValueError("QDRANT_URL and QDRANT_API_KEY must be set in environment variables")
         
+        # The sync client handles one-off startup work (collection setup, bulk
+        # upload); the async client serves per-request searches without
+        # blocking the event loop
         self.qdrant_client = QdrantClient(
             url=settings.QDRANT_URL,
             api_key=settings.QDRANT_API_KEY,
         )
+        self.async_qdrant_client = AsyncQdrantClient(
+            url=settings.QDRANT_URL,
+            api_key=settings.QDRANT_API_KEY,
+        )
         
-        print(f"Initializing embedding model: {settings.EMBEDDING_MODEL}...")
-        self.embedding_model = DefaultEmbedding(model_name=settings.EMBEDDING_MODEL)
+        logger.info("Initializing embedding model: %s...", settings.EMBEDDING_MODEL)
+        self.embedding_model = DefaultEmbedding(
+            model_name=settings.EMBEDDING_MODEL,
+            threads=settings.EMBED_THREADS or os.cpu_count()
+        )
         
-        # Get vector dimension from the model
-        sample_embedding = list(self.embedding_model.embed(["test"]))[0]
-        vector_size = len(sample_embedding)
-        print(f"Vector dimension: {vector_size}")
+        # Get vector dimension, probing the model only if it isn't a known one
+        vector_size = EMBEDDING_DIMS.get(settings.EMBEDDING_MODEL)
+        if vector_size is None:
+            sample_embedding = next(iter(self.embedding_model.embed(["test"])))
+            vector_size = len(sample_embedding)
+        logger.info("Vector dimension: %s", vector_size)
+        
+        # Fixed random hyperplanes for locality-sensitive hashing of query
+        # embeddings; seeded so buckets are stable across restarts
+        if settings.ENABLE_SEM_CACHE:
+            rng = np.random.default_rng(42)
+            self._projection = rng.standard_normal((vector_size, settings.SEM_CACHE_BITS)).astype(np.float32)
         
         # Check if collection exists
         collections = self.qdrant_client.get_collections().collections
@@ -65,30 +152,165 @@ class ChatbotService:
         
         if collection_exists:
             collection_info = self.qdrant_client.get_collection(settings.COLLECTION_NAME)
-            print(f"Loaded existing collection with {collection_info.points_count} items")
+            logger.info("Loaded existing collection with %s items", collection_info.points_count)
+            
+            # Collections populated before compact payloads store the full text;
+            # keep reading it from Qdrant for those
+            sample, _ = self.qdrant_client.scroll(
+                collection_name=settings.COLLECTION_NAME,
+                limit=1,
+                with_payload=True,
+                with_vectors=False
+            )
+            if sample:
+                self._compact_payload = 'instruction' not in sample[0].payload
+                if self._compact_payload:
+                    self._check_compact_collection(collection_info.points_count, sample[0].payload)
         else:
-            print("Creating new collection...")
+            logger.info("Creating new collection...")
             self.qdrant_client.create_collection(
                 collection_name=settings.COLLECTION_NAME,
                 vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
             )
-            await self._populate_collection()
+            try:
+                await self._populate_collection(vector_size)
+            except BaseException:
+                # Don't leave an empty collection behind for the next start to trust
+                self.qdrant_client.delete_collection(settings.COLLECTION_NAME)
+                raise
         
         self._initialized = True
-        print("Chatbot service initialized successfully!")
+        logger.info("Chatbot service initialized successfully!")
+    
+    def _check_compact_collection(self, points_count: int, payload: Dict[str, Any]):
+        """Fail fast if a compact-payload collection wasn't built from the loaded data file"""
+        # Compact points are hydrated from self.data by id, so any drift between
+        # the collection and the file would silently serve another row's text
+        if points_count != len(self.data):
+            raise ValueError(
+                f"Collection '{settings.COLLECTION_NAME}' has {points_count} points but "
+                f"{settings.DATA_PATH} has {len(self.data)} items. Recreate the collection "
+                f"or point DATA_PATH at the file it was built from."
+            )
+        
+        digest = payload.get('data_digest')
+        if digest is None:
+            logger.warning(
+                "Collection '%s' has no data digest; cannot verify it matches %s",
+                settings.COLLECTION_NAME, settings.DATA_PATH
+            )
+        elif digest != self._data_digest:
+            raise ValueError(
+                f"Collection '{settings.COLLECTION_NAME}' was built from a different version of "
+                f"{settings.DATA_PATH}. Recreate the collection or restore the original file."
+            )
     
-    async def _populate_collection(self):
+    async def _populate_collection(self, vector_size: int):
         """Add all instruction-output pairs to Qdrant"""
-        print("Generating embeddings and uploading to Qdrant...")
+        logger.info("Generating embeddings and uploading to Qdrant...")
+        
+        # upload_points batches the lazy point generator and uploads with its own
+        # worker pool; run it in a thread so the event loop stays responsive
+        await asyncio.to_thread(
+            self.qdrant_client.upload_points,
+            collection_name=settings.COLLECTION_NAME,
+            points=self._iter_points(vector_size),
+            batch_size=settings.UPLOAD_BATCH_SIZE,
+            parallel=settings.UPLOAD_PARALLEL,
+            wait=False
+        )
+        
+        logger.info("Uploaded %s items", len(self.data))
+        logger.info("Collection populated successfully!")
+    
+    def _embedding_cache_path(self) -> str:
+        """Path of the on-disk embedding cache for the current data and model"""
+        key = f"{self._data_digest}:{settings.EMBEDDING_MODEL}".encode('utf-8')
+        return os.path.join(settings.EMBEDDING_CACHE_DIR, f"embeds_{hashlib.sha256(key).hexdigest()[:16]}.npy")
+    
+    def _iter_embeddings(self, vector_size: int) -> Iterator[np.ndarray]:
+        """Yield instruction embeddings, reusing the FP16 disk cache when data is unchanged"""
+        cache_path = self._embedding_cache_path() if settings.EMBEDDING_CACHE_DIR else None
+        
+        if cache_path and os.path.exists(cache_path):
+            logger.info("Loading cached embeddings from %s...", cache_path)
+            cached = np.load(cache_path, mmap_mode='r')
+            for row in cached:
+                yield row.astype(np.float32)
+            return
         
         instructions = [item['instruction'] for item in self.data]
+        if settings.EMBEDDING_DEVICE == "cuda":
+            # Bulk encode on the GPU; query-time embedding stays on the CPU model,
+            # where single-row inputs don't pay GPU launch/transfer latency
+            logger.info("Embedding %s items on CUDA...", len(instructions))
+            bulk_model = DefaultEmbedding(
+                model_name=settings.EMBEDDING_MODEL,
+                providers=["CUDAExecutionProvider", "CPUExecutionProvider"]
+            )
+            embeddings = bulk_model.embed(instructions, batch_size=settings.EMBED_BATCH_SIZE)
+        else:
+            embeddings = self.embedding_model.embed(
+                instructions,
+                batch_size=settings.EMBED_BATCH_SIZE,
+                parallel=settings.EMBED_PARALLEL
+            )
         
-        # Generate embeddings in batches
-        embeddings = list(self.embedding_model.embed(instructions))
+        if not cache_path:
+            yield from embeddings
+            return
         
-        # Create points for Qdrant
-        points = []
-        for idx, (item, embedding) in enumerate(zip(self.data, embeddings)):
+        # Write rows into a memory-mapped .npy as they are produced; only
+        # publish the file once every row has been written, otherwise drop it.
+        # The cache is best-effort: an unwritable directory just disables it
+        partial_path = cache_path + ".partial"
+        try:
+            os.makedirs(settings.EMBEDDING_CACHE_DIR, exist_ok=True)
+            cache = np.lib.format.open_memmap(
+                partial_path, mode='w+', dtype=np.float16, shape=(len(instructions), vector_size)
+            )
+        except OSError as e:
+            logger.warning("Embedding cache disabled, cannot write %s: %s", partial_path, e)
+            yield from embeddings
+            return
+        
+        written = 0
+        try:
+            for embedding in embeddings:
+                cache[written] = embedding
+                written += 1
+                yield embedding
+        finally:
+            cache.flush()
+            del cache
+            try:
+                if written == len(instructions):
+                    os.replace(partial_path, cache_path)
+                    logger.info("Saved embedding cache to %s", cache_path)
+                else:
+                    os.remove(partial_path)
+            except OSError as e:
+                logger.warning("Could not save embedding cache to %s: %s", cache_path, e)
+    
+    def _iter_points(self, vector_size: int):
+        """Yield a PointStruct per data item, embedding instructions lazily"""
+        # Drive the loop from the embeddings so their generator runs to the end
+        # and gets to publish the disk cache
+        for idx, embedding in enumerate(self._iter_embeddings(vector_size)):
+            item = self.data[idx]
+            if self._compact_payload:
+                # Text and metadata are served from self.data by point id; the
+                # digest records which data file the ids refer to
+                yield PointStruct(
+                    id=idx,
+                    vector=embedding.tolist(),
+                    payload={
+                        'source': item.get('source', 'data.json'),
+                        'data_digest': self._data_digest
+                    }
+                )
+                continue
+            
             # Build payload with all available data
             payload = {
                 "instruction": item['instruction'],
@@ -106,113 +328,209 @@ class ChatbotService:
             # Add source identifier
             payload['source'] = item.get('source', 'data.json')
             
-            points.append(
-                PointStruct(
-                    id=idx,
-                    vector=embedding.tolist(),
-                    payload=payload
-                )
+            yield PointStruct(
+                id=idx,
+                vector=embedding.tolist(),
+                payload=payload
             )
-        
-        # Upload in batches
-        batch_size = 100
-        for i in range(0, len(points), batch_size):
-            batch = points[i:i + batch_size]
-            self.qdrant_client.upsert(
-                collection_name=settings.COLLECTION_NAME,
-                points=batch
+    
+    async def _embed_batch(self, questions: List[str]) -> list:
+        """Embed a batch of queries in one model call, off the event loop"""
+        return await asyncio.to_thread(
+            lambda: list(self.embedding_model.embed(questions, batch_size=settings.EMBED_BATCH_SIZE))
+        )
+    
+    async def _search_batch(self, searches: List[tuple]) -> list:
+        """Run a batch of (vector, top_k) searches in a single Qdrant request"""
+        with_payload = ['source'] if self._compact_payload else True
+        requests = [
+            QueryRequest(
+                query=vector.tolist(),
+                limit=top_k,
+                with_payload=with_payload,
+                score_threshold=self._threshold
             )
-            print(f"Uploaded {min(i + batch_size, len(points))}/{len(points)} items")
+            for vector, top_k in searches
+        ]
+        responses = await self.async_qdrant_client.query_batch_points(
+            collection_name=self._collection,
+            requests=requests
+        )
+        return [response.points for response in responses]
+    
+    @staticmethod
+    def _embedding_key(user_question: str) -> str:
+        """Text that is embedded and used as the embedding cache key"""
+        # Only surrounding whitespace is dropped: casing can change the vector for
+        # cased models, so differently cased questions are embedded separately
+        return user_question.strip()
+    
+    async def _embed_query(self, user_question: str):
+        """Embed a query, reusing cached vectors for repeated questions"""
+        key = self._embedding_key(user_question)
+        query_embedding = self._embedding_cache.get(key)
+        if query_embedding is None:
+            query_embedding = await self._embed_batcher.submit(key)
+            self._embedding_cache.set(key, query_embedding)
+        return query_embedding
+    
+    def _build_context_items(self, search_results: list) -> List[Dict[str, Any]]:
+        """Turn scored Qdrant points into context items above the similarity threshold"""
+        context_items = []
+        
+        # Results arrive sorted by score; Qdrant already drops those under the
+        # threshold, the break guards against servers that ignore it
+        for result in search_results:
+            if result.score < self._threshold:
+                break
+            
+            # Compact payloads only carry the source; hydrate the rest locally
+            fields = self.data[result.id] if self._compact_payload else result.payload
+            item = {
+                'instruction': fields['instruction'],
+                'output': fields['output'],
+                'similarity': result.score
+            }
+            
+            # Add optional metadata if available
+            if fields.get('channel_username'):
+                item['channel_username'] = fields['channel_username']
+            if fields.get('video_id'):
+                item['video_id'] = fields['video_id']
+            if 'source' in result.payload:
+                item['source'] = result.payload['source']
+            
+            context_items.append(item)
         
-        print("Collection populated successfully!")
+        return context_items
     
-    def retrieve_context(self, user_question: str, top_k: int = None) -> List[Dict[str, Any]]:
+    async def retrieve_context(self, user_question: str, top_k: int = None) -> List[Dict[str, Any]]:
         """Retrieve top K most similar documents"""
         if not self._initialized:
             raise RuntimeError("Chatbot service not initialized")
         
-        top_k = top_k or settings.TOP_K
+        top_k = top_k or self._top_k
         
-        # Generate embedding for the query
-        query_embedding = list(self.embedding_model.embed([user_question]))[0]
+        # Generate embedding for the query (batched with concurrent requests)
+        query_embedding = await self._embed_query(user_question)
         
-        # Search in Qdrant using query_points (official API)
-        search_response = self.qdrant_client.query_points(
-            collection_name=settings.COLLECTION_NAME,
-            query=query_embedding.tolist(),
-            limit=top_k
-        )
+        # Near-duplicate questions hash to the same bucket and reuse its retrieval
+        bucket = None
+        if self._projection is not None:
+            bucket = (np.packbits(query_embedding @ self._projection > 0).tobytes(), top_k)
+            cached = self._semantic_cache.get(bucket)
+            if cached is not None:
+                return cached
         
-        context_items = []
-        for result in search_response.points:
-            if result.score >= settings.SIMILARITY_THRESHOLD:
-                item = {
-                    'instruction': result.payload['instruction'],
-                    'output': result.payload['output'],
-                    'similarity': result.score
-                }
-                
-                # Add optional metadata if available
-                if 'channel_username' in result.payload:
-                    item['channel_username'] = result.payload['channel_username']
-                if 'video_id' in result.payload:
-                    item['video_id'] = result.payload['video_id']
-                if 'source' in result.payload:
-                    item['source'] = result.payload['source']
-                
-                context_items.append(item)
+        # Search in Qdrant (batched with concurrent requests via query_batch_points)
+        search_results = await self._search_batcher.submit((query_embedding, top_k))
+        
+        context_items = self._build_context_items(search_results)
+        
+        if bucket is not None:
+            self._semantic_cache.set(bucket, context_items)
         
         return context_items
     
-    async def generate_response(self, user_question: str, context_items: List[Dict[str, Any]]) -> str:
-        """Generate response using LLM with retrieved context"""
+    async def batch_retrieve_context(self, questions: List[str], top_k: int = None) -> List[List[Dict[str, Any]]]:
+        """Retrieve context for many questions with one embed call and one Qdrant request"""
         if not self._initialized:
             raise RuntimeError("Chatbot service not initialized")
         
-        # Build context string
-        context_text = "\n\n".join([
-            f"Q: {item['instruction']}\nA: {item['output']}"
-            for item in context_items
-        ])
+        top_k = top_k or self._top_k
         
-        # Create prompt
-        prompt = f"""You are a knowledgeable assistant. Answer the user's question based on the following relevant information from the knowledge base.
-
-Relevant Information:
-{context_text}
-
-User Question: {user_question}
-
-Instructions:
-- Answer based on the provided information and context only
-- Provide comprehensive, detailed responses when the question requires it
-- If the information doesn't fully answer the question, say so
-- Synthesize information from multiple sources when relevant
-- Maintain the tone and style of the knowledge base
-- Use examples and explanations where helpful
-- Never give any reference from quran
-
-Answer:"""
+        keys = [self._embedding_key(question) for question in questions]
+        embeddings = [self._embedding_cache.get(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = await self._embed_batch([keys[i] for i in missing])
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+                self._embedding_cache.set(keys[i], embedding)
+        
+        results = await self._search_batch([(embedding, top_k) for embedding in embeddings])
+        return [self._build_context_items(points) for points in results]
+    
+    def _build_prompt(self, user_question: str, context_items: List[Dict[str, Any]]) -> str:
+        """Build the RAG prompt from the question and retrieved context"""
+        parts = [_PROMPT_HEAD]
+        append = parts.append
+        for i, item in enumerate(context_items):
+            if i:
+                append("\n\n")
+            append("Q: ")
+            append(item['instruction'])
+            append("\nA: ")
+            append(item['output'])
+        append(_PROMPT_MID)
+        append(user_question)
+        append(_PROMPT_TAIL)
+        return "".join(parts)
+    
+    async def generate_response(self, user_question: str, context_items: List[Dict[str, Any]]) -> str:
+        """Generate response using LLM with retrieved context"""
+        if not self._initialized:
+            raise RuntimeError("Chatbot service not initialized")
         
-        # System prompt
-        system_prompt = "You are a helpful assistant that answers questions based on provided context."
+        prompt = self._build_prompt(user_question, context_items)
         
         # Call LLM provider
-        response = await self.llm_provider.generate(prompt, system_prompt)
+        response = await self.llm_provider.generate(prompt, SYSTEM_PROMPT)
         
         return response
     
-    async def query(self, user_question: str, top_k: int = None) -> Dict[str, Any]:
-        """Main query method: retrieve context and generate response"""
+    async def query_stream(self, user_question: str, top_k: int = None) -> AsyncIterator[Tuple[str, Any]]:
+        """Streaming query: yield ("context", items) then ("token", text) chunks"""
         if not self._initialized:
             raise RuntimeError("Chatbot service not initialized")
         
+        context_items = await self.retrieve_context(user_question, top_k)
+        yield "context", context_items
+        
+        if not context_items:
+            yield "token", NO_CONTEXT_ANSWER
+            return
+        
+        prompt = self._build_prompt(user_question, context_items)
+        async for text in self.llm_provider.generate_stream(prompt, SYSTEM_PROMPT):
+            yield "token", text
+    
+    async def query(self, user_question: str, top_k: int = None, use_cache: bool = True) -> Dict[str, Any]:
+        """Main query method: serve from the response cache or run the RAG pipeline"""
+        if not self._initialized:
+            raise RuntimeError("Chatbot service not initialized")
+        
+        top_k = top_k or self._top_k
+        if not use_cache:
+            return await self._run_query(user_question, top_k)
+        
+        key = (user_question.strip().lower(), top_k)
+        cached = self._response_cache.get(key)
+        if cached is None:
+            # One in-flight pipeline per key; concurrent callers wait and reuse its result
+            lock = self._inflight.setdefault(key, asyncio.Lock())
+            try:
+                async with lock:
+                    cached = self._response_cache.peek(key)
+                    if cached is None:
+                        result = await self._run_query(user_question, top_k)
+                        cached = {'answer': result['answer'], 'context': result['context']}
+                        self._response_cache.set(key, cached)
+            finally:
+                if self._inflight.get(key) is lock and not lock.locked():
+                    del self._inflight[key]
+        
+        # Entries are shared by every spelling of the key; echo this caller's question
+        return {**cached, 'question': user_question}
+    
+    async def _run_query(self, user_question: str, top_k: int) -> Dict[str, Any]:
+        """Retrieve context and generate a response without caching"""
         # Retrieve relevant documents
-        context_items = self.retrieve_context(user_question, top_k)
+        context_items = await self.retrieve_context(user_question, top_k)
         
         if not context_items:
             return {
-                'answer': "I couldn't find relevant information to answer your question.",
+                'answer': NO_CONTEXT_ANSWER,
                 'context': [],
                 'question': user_question
             }
@@ -226,7 +544,30 @@ Answer:"""
             'question': user_question
         }
     
-    def get_stats(self) -> Dict[str, Any]:
+    async def shutdown(self):
+        """Release network resources held by the service"""
+        if self.llm_provider is not None:
+            await self.llm_provider.aclose()
+        if self.async_qdrant_client is not None:
+            await self.async_qdrant_client.close()
+        if self.qdrant_client is not None:
+            self.qdrant_client.close()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get embedding and response cache statistics"""
+        return {
+            "embedding_cache": self._embedding_cache.stats(),
+            "response_cache": self._response_cache.stats(),
+            "semantic_cache": self._semantic_cache.stats() if self._projection is not None else None
+        }
+    
+    def clear_caches(self):
+        """Drop all cached embeddings and responses"""
+        self._embedding_cache.clear()
+        self._response_cache.clear()
+        self._semantic_cache.clear()
+    
+    async def get_stats(self) -> Dict[str, Any]:
         """Get chatbot statistics"""
         if not self._initialized:
             raise RuntimeError("Chatbot service not initialized")
@@ -239,7 +580,7 @@ Answer:"""
         else:
             model_name = "unknown"
         
-        collection_info = self.qdrant_client.get_collection(settings.COLLECTION_NAME)
+        collection_info = await self.async_qdrant_client.get_collection(settings.COLLECTION_NAME)
         
         return {
             "total_documents": collection_info.points_count,
@@ -248,7 +589,8 @@ Answer:"""
             "embedding_model": settings.EMBEDDING_MODEL,
             "max_tokens": settings.MAX_TOKENS,
             "default_top_k": settings.TOP_K,
-            "vector_db": "Qdrant Cloud"
+            "vector_db": "Qdrant Cloud",
+            "embedding_cache": self._embedding_cache.stats()
         }
     
     @property
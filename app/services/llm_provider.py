@@ -1,9 +1,22 @@
 """LLM Provider abstraction for multiple AI backends"""
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 from openai import AsyncOpenAI
 import httpx
 
+logger = logging.getLogger(__name__)
+
+# Connection pooling for LLM API calls: keep-alive connections are reused
+# across queries and HTTP/2 multiplexes concurrent requests on one connection
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by an LLM provider's API calls"""
+    return httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
@@ -13,10 +26,21 @@ class LLMProvider(ABC):
         """Generate response from the LLM"""
         pass
     
+    @abstractmethod
+    def generate_stream(self, prompt: str, system_prompt: str = None) -> AsyncIterator[str]:
+        """Generate response from the LLM, yielding text chunks as they arrive"""
+        pass
+    
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the provider is properly configured"""
         pass
+    
+    async def aclose(self):
+        """Close the provider's pooled HTTP client, if any"""
+        http_client = getattr(self, "_http", None)
+        if http_client is not None:
+            await http_client.aclose()
 
 
 class OpenAIProvider(LLMProvider):
@@ -27,7 +51,12 @@ class OpenAIProvider(LLMProvider):
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
-        self.client = AsyncOpenAI(api_key=api_key) if api_key else None
+        self._http = None
+        self.client = None
+        
+        if api_key:
+            self._http = build_http_client()
+            self.client = AsyncOpenAI(api_key=api_key, http_client=self._http)
     
     def is_available(self) -> bool:
         return self.client is not None and self.api_key is not None
@@ -50,6 +79,28 @@ class OpenAIProvider(LLMProvider):
         )
         
         return response.choices[0].message.content
+    
+    async def generate_stream(self, prompt: str, system_prompt: str = None) -> AsyncIterator[str]:
+        """Stream response chunks from OpenAI API"""
+        if not self.is_available():
+            raise ValueError("OpenAI provider not configured. Set OPENAI_API_KEY.")
+        
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True
+        )
+        
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
 
 class HuggingFaceProvider(LLMProvider):
@@ -60,15 +111,18 @@ class HuggingFaceProvider(LLMProvider):
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self._http = None
         self.client = None
         
         # Initialize OpenAI client with HuggingFace router
         if api_key:
+            self._http = build_http_client()
             self.client = AsyncOpenAI(
                 base_url="https://router.huggingface.co/v1",
-                api_key=api_key
+                api_key=api_key,
+                http_client=self._http
             )
-            print(f"✅ Hugging Face OpenAI-compatible client initialized with model: {model}")
+            logger.info("Hugging Face OpenAI-compatible client initialized with model: %s", model)
     
     def is_available(self) -> bool:
         return self.client is not None and self.api_key is not None
@@ -96,6 +150,33 @@ class HuggingFaceProvider(LLMProvider):
             
         except Exception as e:
             raise Exception(f"Hugging Face API error: {str(e)}")
+    
+    async def generate_stream(self, prompt: str, system_prompt: str = None) -> AsyncIterator[str]:
+        """Stream response chunks from Hugging Face OpenAI-compatible API"""
+        if not self.is_available():
+            raise ValueError("Hugging Face provider not configured. Set HUGGINGFACE_API_KEY")
+        
+        # Build messages
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stream=True
+            )
+            
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                    
+        except Exception as e:
+            raise Exception(f"Hugging Face API error: {str(e)}")
 
 
 def get_llm_provider(
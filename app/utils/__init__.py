@@ -1 +1,6 @@
 """Utilities module"""
+from .batching import MicroBatcher
+from .cache import LRUCache, TTLCache
+from .http import cached_response, make_etag
+
+__all__ = ["LRUCache", "MicroBatcher", "TTLCache", "cached_response", "make_etag"]
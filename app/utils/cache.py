@@ -0,0 +1,96 @@
+"""In-memory caches used by the chatbot service"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit/miss counters"""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, marking it as recently used"""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value without touching recency or counters"""
+        return self._data.get(key, default)
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries and reset counters"""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit-rate information"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+class TTLCache(LRUCache):
+    """LRU cache whose entries expire after a fixed number of seconds"""
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 3600):
+        super().__init__(maxsize=maxsize)
+        self.ttl = ttl
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key if it has not expired"""
+        entry = super().get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.hits -= 1
+            self.misses += 1
+            return default
+        return value
+    
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value if present and fresh, without counting"""
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return default
+        return entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value that expires after ttl seconds"""
+        super().set(key, (time.monotonic() + self.ttl, value))
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return size, hit-rate and TTL information"""
+        stats = super().stats()
+        stats["ttl"] = self.ttl
+        return stats
@@ -0,0 +1,17 @@
+"""HTTP caching helpers"""
+import hashlib
+
+from fastapi import Request, Response
+
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag for a response body"""
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def cached_response(request: Request, body: bytes, etag: str, max_age: int, media_type: str) -> Response:
+    """Return body with caching headers, or 304 if the client already has it"""
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
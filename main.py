@@ -1,45 +1,63 @@
 """Main FastAPI application entry point"""
+import logging
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.api import router
 from app.services import chatbot_service
+from app.utils.http import make_etag
+
+logging.basicConfig(
+    level=logging.DEBUG if settings.DEBUG else logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events"""
     # Startup
-    print("\n" + "="*60)
-    print(f"🚀 DEBUG: Starting {settings.APP_NAME}")
-    print(f"   Version: {settings.APP_VERSION}")
-    print(f"   Debug mode: {settings.DEBUG}")
-    print(f"   LLM Provider: {settings.LLM_PROVIDER}")
-    print("="*60)
+    logger.info(
+        "Starting %s (version %s, debug=%s, LLM provider=%s)",
+        settings.APP_NAME, settings.APP_VERSION, settings.DEBUG, settings.LLM_PROVIDER
+    )
+    
+    # Load the frontend template once; home() serves it from memory
+    try:
+        with open("templates/index.html", "rb") as f:
+            app.state.index_html = f.read()
+        app.state.index_etag = make_etag(app.state.index_html)
+    except FileNotFoundError:
+        logger.warning("templates/index.html not found, / will return 404")
+        app.state.index_html = None
+        app.state.index_etag = None
+    
+    # Settings don't change while the process runs, so /config is serialized once
+    app.state.config_payload = orjson.dumps(settings.public_config())
+    app.state.config_etag = make_etag(app.state.config_payload)
     
     try:
-        print("🔧 DEBUG: Initializing chatbot service...")
+        logger.info("Initializing chatbot service...")
         await chatbot_service.initialize()
-        print("✅ DEBUG: Chatbot service initialized successfully")
-        print("\n" + "="*60)
-        print(f"🌐 DEBUG: Server ready at: http://{settings.HOST}:{settings.PORT}")
-        print(f"📚 DEBUG: API docs at: http://{settings.HOST}:{settings.PORT}/docs")
-        print(f"🔍 DEBUG: Health check: http://{settings.HOST}:{settings.PORT}/health")
-        print("="*60 + "\n")
-    except Exception as e:
-        print(f"\n❌ DEBUG: Failed to initialize: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.info("Chatbot service initialized successfully")
+        logger.info("Server ready at: http://%s:%s", settings.HOST, settings.PORT)
+        logger.info("API docs at: http://%s:%s/docs", settings.HOST, settings.PORT)
+        logger.info("Health check: http://%s:%s/health", settings.HOST, settings.PORT)
+    except Exception:
+        logger.exception("Failed to initialize")
         raise
     
     yield
     
     # Shutdown
-    print("\n" + "="*60)
-    print("👋 DEBUG: Shutting down...")
-    print("="*60 + "\n")
+    logger.info("Shutting down...")
+    await chatbot_service.shutdown()
 
 
 # Create FastAPI app
@@ -47,7 +65,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     description="Retrieval-Augmented Generation Chatbot with ChromaDB and OpenAI",
     version=settings.APP_VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -1,39 +1,89 @@
 """Clean citations from data"""
-import json
+import multiprocessing
+import os
 import re
 import sys
+from itertools import islice
 from pathlib import Path
 
+import ijson
+import orjson
+
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 
+# Regular expression to match [cite: numbers] pattern including ranges
+_CITE = re.compile(r'\[cite:\s*[\d,\s\-]+\]')
+_PUNCTUATION = frozenset('.,;:!?')
 
-def clean_citations(data_path: str = None):
-    """Remove citation patterns from output field"""
-    data_path = data_path or settings.DATA_PATH
-    
-    print(f"Loading data from {data_path}...")
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+
+def _tighten(text: str) -> str:
+    """Collapse whitespace runs, trim both ends and drop spaces before punctuation in one pass"""
+    words = text.split()
+    if not words:
+        return ''
+    out = [words[0]]
+    for word in words[1:]:
+        # A word starting with punctuation is glued to the previous one
+        if word[0] in _PUNCTUATION:
+            out[-1] += word
+        else:
+            out.append(word)
+    return ' '.join(out)
+
+
+def _clean_output(text: str) -> str:
+    """Remove citations, collapse whitespace and drop spaces before punctuation"""
+    if '[cite:' in text:
+        text = _CITE.sub('', text)
+    return _tighten(text)
+
+
+def _clean_record(item: dict) -> bytes:
+    """Clean one record and serialize it; runs in the worker processes"""
+    if 'output' in item:
+        item['output'] = _clean_output(item['output'])
     
-    # Regular expression to match [cite: numbers] pattern including ranges
-    citation_pattern = r'\[cite:\s*[\d,\s\-]+\]'
+    # Same layout as dumping the whole list with a 2-space indent
+    return orjson.dumps(item, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  ')
+
+
+def clean_citations(data_path: str = None, processes: int = None, chunksize: int = 1024):
+    """Remove citation patterns from output field
     
-    print("Removing citations...")
-    for item in data:
-        if 'output' in item:
-            # Remove all citation patterns
-            item['output'] = re.sub(citation_pattern, '', item['output'])
-            # Clean up spaces
-            item['output'] = re.sub(r'\s+', ' ', item['output'])
-            item['output'] = re.sub(r'\s+([.,;:!?])', r'\1', item['output'])
-            item['output'] = item['output'].strip()
+    Records are cleaned across a pool of `processes` workers (default: all cores),
+    `chunksize` records per worker at a time.
+    """
+    data_path = data_path or settings.DATA_PATH
+    tmp_path = f"{data_path}.tmp"
     
-    print(f"Saving cleaned data to {data_path}...")
-    with open(data_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Records are streamed in bounded slices into a temp file, which then
+    # replaces the original, so memory use doesn't grow with the dataset size
+    print(f"Cleaning citations in {data_path}...")
+    processes = processes or os.cpu_count() or 1
+    count = 0
+    try:
+        with open(data_path, 'rb') as fin, open(tmp_path, 'wb') as fout, \
+                multiprocessing.Pool(processes) as pool:
+            fout.write(b'[')
+            items = ijson.items(fin, 'item', use_float=True)
+            # Pool.imap would drain the whole stream up front; read one slice
+            # per round instead so at most processes * chunksize records are held
+            while slice_ := list(islice(items, processes * chunksize)):
+                for record in pool.map(_clean_record, slice_, chunksize=chunksize):
+                    fout.write(b',\n  ' if count else b'\n  ')
+                    fout.write(record)
+                    count += 1
+            fout.write(b'\n]' if count else b']')
+        
+        os.replace(tmp_path, data_path)
+    finally:
+        # Only left behind if cleaning failed part-way
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    print(f"Saved {count} cleaned items to {data_path}")
     
     print("✅ Citations removed successfully!")
 
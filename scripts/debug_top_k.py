@@ -32,13 +32,14 @@ def debug_top_k():
     env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
     if os.path.exists(env_path):
         with open(env_path, 'r') as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines, 1):
-                if 'TOP_K' in line and not line.strip().startswith('#'):
+            # Stream the file and stop at the first active TOP_K line
+            for i, line in enumerate(f, 1):
+                if 'TOP_K' in line and not (stripped := line.lstrip()).startswith('#'):
                     print(f"  Line {i}: {line.strip()}")
                     # Check for leading spaces
-                    if line.startswith(' ') or line.startswith('\t'):
+                    if len(stripped) != len(line):
                         print(f"  ⚠️  WARNING: Line has leading whitespace!")
+                    break
     else:
         print(f"  ❌ .env file not found at: {env_path}")
     
@@ -60,7 +61,7 @@ def debug_top_k():
             
             # Test retrieve_context with default top_k
             print(f"  Calling retrieve_context with default top_k...")
-            context = chatbot_service.retrieve_context("test question")
+            context = await chatbot_service.retrieve_context("test question")
             print(f"  Expected: {settings.TOP_K} results")
             print(f"  Actual: {len(context)} results")
             
@@ -71,7 +72,7 @@ def debug_top_k():
             
             # Test with explicit top_k
             print(f"\n  Calling retrieve_context with explicit top_k=10...")
-            context = chatbot_service.retrieve_context("test question", top_k=10)
+            context = await chatbot_service.retrieve_context("test question", top_k=10)
             print(f"  Expected: 10 results")
             print(f"  Actual: {len(context)} results")
             
@@ -4,37 +4,103 @@ Handles different formats:
 - data.json: {instruction, input, output}
 - data_new.json: {instruction, input, output, channel_username, video_id}
 """
-import json
 import asyncio
+import contextlib
+import hashlib
+import struct
 import sys
 import os
-from typing import List, Dict, Any
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+import numpy as np
+import orjson
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import (
+    Batch,
+    Distance,
+    HnswConfigDiff,
+    PayloadSchemaType,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
 from fastembed.embedding import DefaultEmbedding
-from app.core.config import settings
+from app.core.config import settings, EMBEDDING_DIMS
+
+# Sidecar key caches: a header with the key format version, the source file's
+# mtime_ns, size and key count, followed by the keys; everything is little-endian.
+# Bump _KEYS_VERSION whenever instruction_key() changes so old sidecars are ignored
+_KEYS_VERSION = 1
+_KEYS_HEADER = struct.Struct('<IqqQ')
+
+
+def instruction_key(instruction: str) -> int:
+    """64-bit digest of a normalized instruction, used for duplicate detection"""
+    normalized = instruction.strip().casefold()
+    if not normalized:
+        return 0
+    return int.from_bytes(hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def _keys_header(file_path: str, count: int) -> bytes:
+    """Header identifying the exact version of file_path the cached keys belong to"""
+    stat = os.stat(file_path)
+    return _KEYS_HEADER.pack(_KEYS_VERSION, stat.st_mtime_ns, stat.st_size, count)
+
+
+def load_instruction_keys(file_path: str, data: List[Dict[str, Any]]) -> List[int]:
+    """Dedup keys for every record in data, reused from <file_path>.keys.bin when the source is unchanged"""
+    keys_path = Path(f"{file_path}.keys.bin")
+    header = _keys_header(file_path, len(data))
+    
+    keys_format = f'<{len(data)}Q'
+    
+    # Reuse the sidecar only if it belongs to this file and isn't truncated
+    if keys_path.exists():
+        raw = keys_path.read_bytes()
+        if raw[:_KEYS_HEADER.size] == header and len(raw) == _KEYS_HEADER.size + 8 * len(data):
+            print(f"  Reusing dedup keys from {keys_path}")
+            return list(struct.unpack_from(keys_format, raw, _KEYS_HEADER.size))
+    
+    keys = [instruction_key(item.get('instruction', '')) for item in data]
+    
+    # The sidecar is only an optimization; a read-only data directory just skips it
+    tmp_path = keys_path.with_name(keys_path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(header + struct.pack(keys_format, *keys))
+        os.replace(tmp_path, keys_path)
+    except OSError as e:
+        print(f"  ⚠️  Could not write dedup key cache {keys_path}: {e}")
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+    return keys
 
 
 def load_and_normalize_data(file_path: str, has_metadata: bool = False) -> List[Dict[str, Any]]:
     """Load JSON data and normalize format"""
     print(f"Loading {file_path}...")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = orjson.loads(Path(file_path).read_bytes())
+    keys = load_instruction_keys(file_path, data)
     
     normalized_data = []
-    for item in data:
+    for item, key in zip(data, keys):
         normalized_item = {
             'instruction': item.get('instruction', ''),
             'input': item.get('input', ''),
             'output': item.get('output', ''),
             'channel_username': item.get('channel_username', None),
             'video_id': item.get('video_id', None),
-            'source': 'data_new.json' if has_metadata else 'data.json'
+            'source': 'data_new.json' if has_metadata else 'data.json',
+            # Dedup key, computed once here; removed again before saving
+            '_key': key
         }
         normalized_data.append(normalized_item)
     
@@ -46,23 +112,24 @@ def merge_datasets(old_data: List[Dict], new_data: List[Dict]) -> List[Dict]:
     """Merge two datasets and remove duplicates"""
     print("\nMerging datasets...")
     
-    # Create a set of unique instructions to detect duplicates
-    seen_instructions = set()
+    # Track 64-bit digests of normalized instructions rather than the strings
+    # themselves; 0 marks an empty instruction
+    seen_keys = set()
     merged_data = []
     
     # Add old data first
     for item in old_data:
-        instruction = item['instruction'].strip().lower()
-        if instruction and instruction not in seen_instructions:
-            seen_instructions.add(instruction)
+        key = item['_key']
+        if key and key not in seen_keys:
+            seen_keys.add(key)
             merged_data.append(item)
     
     # Add new data, skipping duplicates
     duplicates = 0
     for item in new_data:
-        instruction = item['instruction'].strip().lower()
-        if instruction and instruction not in seen_instructions:
-            seen_instructions.add(instruction)
+        key = item['_key']
+        if key and key not in seen_keys:
+            seen_keys.add(key)
             merged_data.append(item)
         else:
             duplicates += 1
@@ -79,8 +146,8 @@ def save_merged_data(data: List[Dict], output_path: str):
     """Save merged data to file"""
     print(f"\nSaving merged data to {output_path}...")
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    records = [{k: v for k, v in item.items() if k != '_key'} for item in data]
+    Path(output_path).write_bytes(orjson.dumps(records, option=orjson.OPT_INDENT_2))
     
     print(f"  Saved successfully!")
 
@@ -89,25 +156,36 @@ async def create_qdrant_collection(
     collection_name: str,
     data: List[Dict],
     qdrant_client: QdrantClient,
-    embedding_model: DefaultEmbedding
+    async_qdrant_client: AsyncQdrantClient,
+    embedding_model: DefaultEmbedding,
+    embed_batch_size: int = 128,
+    embed_parallel: Optional[int] = 0,
+    upload_concurrency: int = 8
 ):
-    """Create a new Qdrant collection with embeddings"""
+    """Create a new Qdrant collection with embeddings
+    
+    embed_batch_size sets how many texts go through each ONNX forward pass;
+    embed_parallel is FastEmbed's worker process count (0 = all cores, None = in-process).
+    Up to upload_concurrency upserts are in flight at once on the async client.
+    """
     
     print(f"\n{'='*80}")
     print(f"Creating Qdrant Collection: {collection_name}")
     print(f"{'='*80}")
     
-    # Get vector dimension
+    # Get vector dimension from the model itself (newer fastembed), then the
+    # table of known models, and only probe with a sample embedding as a last resort
     print("Getting vector dimensions...")
-    sample_embedding = list(embedding_model.embed(["test"]))[0]
-    vector_size = len(sample_embedding)
+    vector_size = getattr(embedding_model, 'embedding_size', None)
+    if vector_size is None:
+        vector_size = EMBEDDING_DIMS.get(getattr(embedding_model, 'model_name', None))
+    if vector_size is None:
+        sample_embedding = next(iter(embedding_model.embed(["test"])))
+        vector_size = len(sample_embedding)
     print(f"  Vector dimension: {vector_size}")
     
     # Check if collection exists
-    collections = qdrant_client.get_collections().collections
-    collection_exists = any(c.name == collection_name for c in collections)
-    
-    if collection_exists:
+    if qdrant_client.collection_exists(collection_name):
         print(f"\n⚠️  Collection '{collection_name}' already exists!")
         response = input("Do you want to delete and recreate it? (yes/no): ")
         if response.lower() == 'yes':
@@ -123,54 +201,89 @@ async def create_qdrant_collection(
     qdrant_client.create_collection(
         collection_name=collection_name,
         vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
+        # HNSW graph on disk; int8 copies of the vectors stay in RAM for scoring
+        hnsw_config=HnswConfigDiff(m=16, ef_construct=128, on_disk=True),
+        quantization_config=ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+        ),
     )
+    
+    # Keyword indexes so filters on these fields don't scan every payload
+    for field_name in ('channel_username', 'source'):
+        qdrant_client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=PayloadSchemaType.KEYWORD,
+        )
     print("  Collection created!")
     
-    # Generate embeddings
-    print("\nGenerating embeddings...")
+    # Generate embeddings and upload as they are produced
+    print("\nGenerating embeddings and uploading to Qdrant...")
     instructions = [item['instruction'] for item in data]
-    embeddings = list(embedding_model.embed(instructions))
-    print(f"  Generated {len(embeddings)} embeddings")
-    
-    # Create points with metadata
-    print("\nCreating points with metadata...")
-    points = []
-    for idx, (item, embedding) in enumerate(zip(data, embeddings)):
-        # Build payload with all available metadata
-        payload = {
-            'instruction': item['instruction'],
-            'output': item['output'],
-            'source': item['source']
-        }
-        
-        # Add optional metadata if available
-        if item.get('channel_username'):
-            payload['channel_username'] = item['channel_username']
-        if item.get('video_id'):
-            payload['video_id'] = item['video_id']
-        if item.get('input'):
-            payload['input'] = item['input']
-        
-        points.append(
-            PointStruct(
-                id=idx,
-                vector=embedding.tolist(),
-                payload=payload
+    total = len(instructions)
+    batch_size = 100
+    uploaded = 0
+    semaphore = asyncio.Semaphore(upload_concurrency)
+    
+    async def upload(batch: Batch):
+        nonlocal uploaded
+        try:
+            await async_qdrant_client.upsert(
+                collection_name=collection_name,
+                points=batch
             )
-        )
-    
-    print(f"  Created {len(points)} points")
+        finally:
+            semaphore.release()
+        uploaded += len(batch.ids)
+        print(f"  Uploaded {uploaded}/{total} items")
+    
+    embeddings = embedding_model.embed(
+        instructions,
+        batch_size=embed_batch_size,
+        parallel=embed_parallel
+    )
     
-    # Upload in batches
-    print("\nUploading to Qdrant...")
-    batch_size = 100
-    for i in range(0, len(points), batch_size):
-        batch = points[i:i + batch_size]
-        qdrant_client.upsert(
-            collection_name=collection_name,
-            points=batch
-        )
-        print(f"  Uploaded {min(i + batch_size, len(points))}/{len(points)} items")
+    def next_vectors() -> List:
+        """Pull the next batch_size embeddings; runs in a worker thread"""
+        return list(islice(embeddings, batch_size))
+    
+    # The task group waits for every upsert; if one fails, the rest are
+    # cancelled instead of being left running in the background
+    async with asyncio.TaskGroup() as uploads:
+        batch_start = 0
+        # Embedding runs in a thread so the event loop keeps driving the
+        # in-flight upserts while the next batch is being computed
+        while batch_vectors := await asyncio.to_thread(next_vectors):
+            batch_payloads = []
+            for item in data[batch_start:batch_start + len(batch_vectors)]:
+                # Build payload with all available metadata
+                payload = {
+                    'instruction': item['instruction'],
+                    'output': item['output'],
+                    'source': item['source']
+                }
+                
+                # Add optional metadata if available
+                if item.get('channel_username'):
+                    payload['channel_username'] = item['channel_username']
+                if item.get('video_id'):
+                    payload['video_id'] = item['video_id']
+                if item.get('input'):
+                    payload['input'] = item['input']
+                
+                batch_payloads.append(payload)
+            
+            # One column-oriented Batch per upsert: the vectors are converted with a
+            # single ndarray.tolist() instead of one call and one PointStruct per point
+            batch = Batch(
+                ids=list(range(batch_start, batch_start + len(batch_vectors))),
+                vectors=np.stack(batch_vectors).astype(np.float32, copy=False).tolist(),
+                payloads=batch_payloads
+            )
+            # Waits here only when upload_concurrency upserts are already in flight
+            await semaphore.acquire()
+            uploads.create_task(upload(batch))
+            batch_start += len(batch_vectors)
     
     print("\n✅ Collection created successfully!")
     
@@ -200,20 +313,20 @@ async def test_search(
         "What is the burden of proof?",
     ]
     
-    for query in test_queries:
+    # Embed all queries in one pass, then run every search in one round-trip
+    query_embeddings = list(embedding_model.embed(test_queries))
+    search_responses = qdrant_client.query_batch_points(
+        collection_name=collection_name,
+        requests=[
+            QueryRequest(query=embedding.tolist(), limit=3, with_payload=True)
+            for embedding in query_embeddings
+        ]
+    )
+    
+    for query, search_response in zip(test_queries, search_responses):
         print(f"\n📝 Query: {query}")
         print("-" * 80)
         
-        # Generate query embedding
-        query_embedding = list(embedding_model.embed([query]))[0]
-        
-        # Search using query_points (official API)
-        search_response = qdrant_client.query_points(
-            collection_name=collection_name,
-            query=query_embedding.tolist(),
-            limit=3
-        )
-        
         for i, result in enumerate(search_response.points, 1):
             print(f"\n{i}. Score: {result.score:.4f}")
             print(f"   Instruction: {result.payload['instruction'][:100]}...")
@@ -263,7 +376,10 @@ async def main():
     print("STEP 3: Saving Merged Data")
     print(f"{'='*80}")
     
-    save_merged_data(merged_data, MERGED_DATA_PATH)
+    # The write runs in a thread and overlaps with loading services in step 4
+    save_task = asyncio.create_task(
+        asyncio.to_thread(save_merged_data, merged_data, MERGED_DATA_PATH)
+    )
     
     # Step 4: Initialize Qdrant and embedding model
     print(f"\n{'='*80}")
@@ -271,18 +387,31 @@ async def main():
     print(f"{'='*80}")
     
     if not settings.QDRANT_URL or not settings.QDRANT_API_KEY:
+        await save_task
         print("❌ Error: QDRANT_URL and QDRANT_API_KEY must be set in .env file")
         return
     
+    # Bulk ingest goes over gRPC: protobuf-packed vectors instead of JSON floats
     print("Connecting to Qdrant...")
     qdrant_client = QdrantClient(
         url=settings.QDRANT_URL,
         api_key=settings.QDRANT_API_KEY,
+        prefer_grpc=True,
+        grpc_port=6334,
+    )
+    async_qdrant_client = AsyncQdrantClient(
+        url=settings.QDRANT_URL,
+        api_key=settings.QDRANT_API_KEY,
+        prefer_grpc=True,
+        grpc_port=6334,
     )
     print("  Connected!")
     
     print(f"Loading embedding model: {settings.EMBEDDING_MODEL}...")
-    embedding_model = DefaultEmbedding(model_name=settings.EMBEDDING_MODEL)
+    _, embedding_model = await asyncio.gather(
+        save_task,
+        asyncio.to_thread(DefaultEmbedding, model_name=settings.EMBEDDING_MODEL)
+    )
     print("  Loaded!")
     
     # Step 5: Create Qdrant collection
@@ -290,12 +419,16 @@ async def main():
     print("STEP 5: Creating Qdrant Collection")
     print(f"{'='*80}")
     
-    await create_qdrant_collection(
-        collection_name=NEW_COLLECTION_NAME,
-        data=merged_data,
-        qdrant_client=qdrant_client,
-        embedding_model=embedding_model
-    )
+    try:
+        await create_qdrant_collection(
+            collection_name=NEW_COLLECTION_NAME,
+            data=merged_data,
+            qdrant_client=qdrant_client,
+            async_qdrant_client=async_qdrant_client,
+            embedding_model=embedding_model
+        )
+    finally:
+        await async_qdrant_client.close()
     
     # Step 6: Test search
     print(f"\n{'='*80}")
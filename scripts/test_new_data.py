@@ -39,7 +39,7 @@ async def test_new_data():
         print("-" * 80)
         
         # Retrieve context
-        context = chatbot_service.retrieve_context(query, top_k=3)
+        context = await chatbot_service.retrieve_context(query, top_k=3)
         
         if not context:
             print("❌ No results found!")
@@ -71,7 +71,7 @@ async def test_new_data():
     print(f"{'='*80}")
     
     # Get stats
-    stats = chatbot_service.get_stats()
+    stats = await chatbot_service.get_stats()
     print(f"\nCurrent Configuration:")
     print(f"  Total documents: {stats['total_documents']}")
     print(f"  Embedding model: {stats['embedding_model']}")
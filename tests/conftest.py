@@ -0,0 +1,47 @@
+"""Shared test setup"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# The maintenance scripts aren't a package; make them importable by module name
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+
+class FakeEmbedding:
+    """Deterministic stand-in for the FastEmbed model
+    
+    Texts listed in ``vectors`` get that vector; any other text gets a
+    ``size``-long vector filled with its length. Every embed() call and every
+    embedded text is recorded, optionally with a per-text ``delay`` and an
+    ("embedded", text) entry appended to a shared ``events`` log.
+    """
+
+    def __init__(self, size=4, vectors=None, delay=0.0, events=None):
+        self.embedding_size = size
+        self.vectors = vectors or {}
+        self.delay = delay
+        self.events = events
+        self.calls = 0
+        self.texts = []
+
+    def embed(self, texts, **kwargs):
+        self.calls += 1
+        for text in texts:
+            if self.delay:
+                time.sleep(self.delay)
+            self.texts.append(text)
+            if self.events is not None:
+                self.events.append(("embedded", text))
+            vector = self.vectors.get(text)
+            if vector is None:
+                vector = np.full(self.embedding_size, len(text))
+            yield np.asarray(vector, dtype=np.float32)
+
+
+@pytest.fixture
+def fake_embedding():
+    """Factory for FakeEmbedding models"""
+    return FakeEmbedding
@@ -0,0 +1,44 @@
+"""Batched retrieval for many questions in one embed call and one Qdrant request"""
+import asyncio
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from app.services.chatbot_qdrant import ChatbotService
+
+VECTORS = {
+    "What is Islam?": [1.0, 0.0, 0.0],
+    "What is Ramadan?": [0.0, 1.0, 0.0],
+}
+
+
+def test_batch_retrieve_context_matches_each_question(fake_embedding):
+    service = ChatbotService()
+    service._initialized = True
+    service._compact_payload = False
+    service._threshold = 0.5
+    service.embedding_model = fake_embedding(size=3, vectors=VECTORS)
+
+    async def scenario():
+        client = AsyncQdrantClient(":memory:")
+        service.async_qdrant_client = client
+        await client.create_collection(
+            collection_name=service._collection,
+            vectors_config=VectorParams(size=3, distance=Distance.COSINE),
+        )
+        await client.upsert(
+            collection_name=service._collection,
+            points=[
+                PointStruct(id=idx, vector=vector, payload={'instruction': text, 'output': text.upper()})
+                for idx, (text, vector) in enumerate(VECTORS.items())
+            ],
+        )
+        return await service.batch_retrieve_context(list(VECTORS), top_k=2)
+
+    contexts = asyncio.run(scenario())
+
+    assert service.embedding_model.calls == 1
+    assert [[item['instruction'] for item in context] for context in contexts] == [
+        ["What is Islam?"],
+        ["What is Ramadan?"],
+    ]
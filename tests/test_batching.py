@@ -0,0 +1,50 @@
+"""MicroBatcher must resolve every submitted future"""
+import asyncio
+
+from app.utils.batching import MicroBatcher
+
+
+def test_results_are_returned_in_submission_order():
+    async def double(items):
+        return [item * 2 for item in items]
+
+    async def scenario():
+        batcher = MicroBatcher(double, max_batch_size=8, window_ms=1)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert asyncio.run(scenario()) == [0, 2, 4, 6, 8]
+
+
+def test_short_result_list_fails_every_caller():
+    async def drop_last(items):
+        return items[:-1]
+
+    async def scenario():
+        batcher = MicroBatcher(drop_last, max_batch_size=8, window_ms=1)
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True),
+            timeout=1
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_cancelled_batch_cancels_waiters():
+    async def scenario():
+        running = asyncio.Event()
+
+        async def never_finishes(items):
+            running.set()
+            await asyncio.sleep(3600)
+
+        batcher = MicroBatcher(never_finishes, max_batch_size=1, window_ms=1)
+        waiter = asyncio.ensure_future(batcher.submit("x"))
+        await running.wait()
+        for task in list(batcher._tasks):
+            task.cancel()
+        await asyncio.wait_for(asyncio.gather(waiter, return_exceptions=True), timeout=1)
+        return waiter
+
+    waiter = asyncio.run(scenario())
+    assert waiter.cancelled()
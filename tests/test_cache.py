@@ -0,0 +1,50 @@
+"""LRU eviction and TTL expiry of the in-memory caches"""
+from app.utils import cache as cache_module
+from app.utils.cache import LRUCache, TTLCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.peek("b") is None
+    assert cache.peek("a") == 1
+    assert cache.peek("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_zero_size_stores_nothing():
+    cache = LRUCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_entry_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+
+    now[0] += 9
+    assert cache.get("a") == 1
+    assert cache.peek("a") == 1
+
+    now[0] += 2
+    assert cache.peek("a") is None
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_ttl_cache_still_evicts_by_size(monkeypatch):
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: 0.0)
+    cache = TTLCache(maxsize=1, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
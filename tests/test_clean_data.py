@@ -0,0 +1,121 @@
+"""Citation cleanup in clean_data"""
+import json
+import random
+import re
+
+import pytest
+
+import clean_data
+
+
+def regex_pipeline(text):
+    """The original three-regex cleanup that _clean_output must reproduce"""
+    text = re.sub(r'\[cite:\s*[\d,\s\-]+\]', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s+([.,;:!?])', r'\1', text)
+    return text.strip()
+
+
+def fuzz_cases(count=20000, seed=0):
+    rnd = random.Random(seed)
+    tokens = ['a', 'bb', ' ', '  ', '\t', '\n', ' ', '.', ',', ';', '!', '?', ':',
+              '[cite: 1, 2]', '[cite:3-4]', '[cite: x]', 'x', ' .', ' ,', '…']
+    for _ in range(count):
+        yield ''.join(rnd.choice(tokens) for _ in range(rnd.randint(0, 15)))
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "   ",
+    "Plain text.",
+    "Spaced , out ; words ! really ?",
+    "Cited claim [cite: 1, 2] here .",
+    "  leading and trailing\n\t ",
+    ". starts with punctuation",
+    "ranges [cite: 3-5,7]and more",
+])
+def test_clean_output_matches_regex_pipeline(text):
+    assert clean_data._clean_output(text) == regex_pipeline(text)
+
+
+def test_clean_output_matches_regex_pipeline_on_fuzzed_input():
+    mismatches = [text for text in fuzz_cases() if clean_data._clean_output(text) != regex_pipeline(text)]
+    assert mismatches == []
+
+
+def write_records(path, records):
+    path.write_text(json.dumps(records, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def test_clean_citations_rewrites_file(tmp_path):
+    records = [{"instruction": f"Q{i}", "output": f"Answer {i} [cite: {i}] ."} for i in range(25)]
+    records.append({"instruction": "no output"})
+    data_path = tmp_path / "data.json"
+    write_records(data_path, records)
+
+    clean_data.clean_citations(str(data_path), processes=2, chunksize=3)
+
+    cleaned = json.loads(data_path.read_text(encoding="utf-8"))
+    assert cleaned[:25] == [{"instruction": f"Q{i}", "output": f"Answer {i}."} for i in range(25)]
+    assert cleaned[25] == {"instruction": "no output"}
+    # Same layout as json.dump(..., indent=2)
+    assert data_path.read_text(encoding="utf-8") == json.dumps(cleaned, indent=2, ensure_ascii=False)
+    assert not (tmp_path / "data.json.tmp").exists()
+
+
+class SerialPool:
+    """In-process pool that records how far the input stream had been read at each map()"""
+
+    consumed = 0
+    calls = []
+
+    def __init__(self, processes):
+        self.processes = processes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, func, items, chunksize):
+        SerialPool.calls.append((len(items), SerialPool.consumed))
+        return [func(item) for item in items]
+
+
+def test_clean_citations_reads_bounded_slices(tmp_path, monkeypatch):
+    records = [{"output": f"text {i}"} for i in range(50)]
+    data_path = tmp_path / "data.json"
+    write_records(data_path, records)
+
+    real_items = clean_data.ijson.items
+
+    def counting_items(*args, **kwargs):
+        for item in real_items(*args, **kwargs):
+            SerialPool.consumed += 1
+            yield item
+
+    SerialPool.consumed, SerialPool.calls = 0, []
+    monkeypatch.setattr(clean_data.ijson, "items", counting_items)
+    monkeypatch.setattr(clean_data.multiprocessing, "Pool", SerialPool)
+
+    clean_data.clean_citations(str(data_path), processes=2, chunksize=4)
+
+    # Each round holds at most processes * chunksize records and never reads ahead
+    assert [size for size, _ in SerialPool.calls] == [8] * 6 + [2]
+    read_so_far = 0
+    for size, consumed in SerialPool.calls:
+        read_so_far += size
+        assert consumed == read_so_far
+
+
+def test_failed_clean_keeps_original_and_removes_temp_file(tmp_path):
+    data_path = tmp_path / "data.json"
+    original = '[{"output": "a"}, {'
+    data_path.write_text(original, encoding="utf-8")
+
+    with pytest.raises(Exception):
+        clean_data.clean_citations(str(data_path), processes=1, chunksize=1)
+
+    assert data_path.read_text(encoding="utf-8") == original
+    assert not (tmp_path / "data.json.tmp").exists()
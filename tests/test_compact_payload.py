@@ -0,0 +1,30 @@
+"""Compact-payload collections must match the data file they were built from"""
+import pytest
+
+from app.services.chatbot_qdrant import ChatbotService
+
+DATA = [
+    {"instruction": "What is Islam?", "output": "A religion."},
+    {"instruction": "What is the burden of proof?", "output": "On the claimant."},
+]
+
+
+def make_service(digest="abc123"):
+    service = ChatbotService()
+    service.data = DATA
+    service._data_digest = digest
+    return service
+
+
+def test_matching_collection_passes():
+    make_service()._check_compact_collection(len(DATA), {"source": "data.json", "data_digest": "abc123"})
+
+
+def test_point_count_mismatch_fails_fast():
+    with pytest.raises(ValueError, match="points"):
+        make_service()._check_compact_collection(len(DATA) + 1, {"data_digest": "abc123"})
+
+
+def test_data_digest_mismatch_fails_fast():
+    with pytest.raises(ValueError, match="different version"):
+        make_service()._check_compact_collection(len(DATA), {"data_digest": "fff000"})
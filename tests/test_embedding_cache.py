@@ -0,0 +1,75 @@
+"""On-disk embedding cache used when populating the Qdrant collection"""
+import asyncio
+import json
+import os
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from app.core.config import settings
+from app.services.chatbot_qdrant import ChatbotService
+
+VECTOR_SIZE = 4
+
+
+DATA = [
+    {"instruction": "What is Islam?", "output": "A religion."},
+    {"instruction": "What is the burden of proof?", "output": "On the claimant."},
+    {"instruction": "Is the Quran a book of science?", "output": "No."},
+]
+
+
+def make_service(tmp_path, monkeypatch, cache_dir, embedding_model):
+    data_path = tmp_path / "data.json"
+    data_path.write_text(json.dumps(DATA), encoding="utf-8")
+
+    monkeypatch.setattr(settings, "DATA_PATH", str(data_path))
+    monkeypatch.setattr(settings, "EMBEDDING_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(settings, "EMBEDDING_DEVICE", "cpu")
+    monkeypatch.setattr(settings, "UPLOAD_PARALLEL", 1)
+
+    service = ChatbotService()
+    service.data = DATA
+    service._data_digest = "0123456789abcdef"
+    service.embedding_model = embedding_model
+    service.qdrant_client = QdrantClient(":memory:")
+    return service
+
+
+def populate(service):
+    if service.qdrant_client.collection_exists(settings.COLLECTION_NAME):
+        service.qdrant_client.delete_collection(settings.COLLECTION_NAME)
+    service.qdrant_client.create_collection(
+        collection_name=settings.COLLECTION_NAME,
+        vectors_config=VectorParams(size=VECTOR_SIZE, distance=Distance.COSINE),
+    )
+    asyncio.run(service._populate_collection(VECTOR_SIZE))
+    assert service.qdrant_client.count(settings.COLLECTION_NAME).count == len(DATA)
+
+
+def test_second_populate_reads_embedding_cache(tmp_path, monkeypatch, fake_embedding):
+    cache_dir = tmp_path / "cache"
+    service = make_service(tmp_path, monkeypatch, cache_dir, fake_embedding(size=VECTOR_SIZE))
+
+    populate(service)
+    populate(service)
+
+    # The first populate embedded and published the cache; the second read it back
+    assert service.embedding_model.calls == 1
+    assert sorted(os.listdir(cache_dir)) == [os.path.basename(service._embedding_cache_path())]
+    cached = np.load(service._embedding_cache_path())
+    assert cached.dtype == np.float16
+    assert cached.shape == (len(DATA), VECTOR_SIZE)
+
+
+def test_unwritable_cache_dir_populates_uncached(tmp_path, monkeypatch, fake_embedding):
+    # A regular file where the directory should be makes every cache write fail
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    service = make_service(tmp_path, monkeypatch, blocker / "cache", fake_embedding(size=VECTOR_SIZE))
+
+    populate(service)
+    populate(service)
+
+    assert service.embedding_model.calls == 2
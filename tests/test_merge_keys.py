@@ -0,0 +1,60 @@
+"""Dedup key sidecar cache used by merge_and_create_embeddings"""
+import json
+import os
+
+import merge_and_create_embeddings as merge
+
+DATA = [{"instruction": f"Question {i}?", "output": "Answer."} for i in range(20)]
+
+
+def write_data(tmp_path):
+    data_path = tmp_path / "data.json"
+    data_path.write_text(json.dumps(DATA), encoding="utf-8")
+    return str(data_path)
+
+
+def expected_keys():
+    return [merge.instruction_key(item["instruction"]) for item in DATA]
+
+
+def test_sidecar_is_reused_when_source_is_unchanged(tmp_path, monkeypatch):
+    data_path = write_data(tmp_path)
+    keys = expected_keys()
+    assert merge.load_instruction_keys(data_path, DATA) == keys
+
+    # A second load must not hash anything
+    monkeypatch.setattr(merge, "instruction_key", lambda instruction: 1 / 0)
+    assert merge.load_instruction_keys(data_path, DATA) == keys
+
+
+def test_truncated_sidecar_is_recomputed(tmp_path):
+    data_path = write_data(tmp_path)
+    merge.load_instruction_keys(data_path, DATA)
+    keys_path = tmp_path / "data.json.keys.bin"
+    raw = keys_path.read_bytes()
+
+    # Whole keys missing, and a length that isn't a multiple of 8
+    for cut in (80, 83):
+        keys_path.write_bytes(raw[:-cut])
+        assert merge.load_instruction_keys(data_path, DATA) == expected_keys()
+        assert keys_path.read_bytes() == raw
+
+
+def test_sidecar_from_another_key_version_is_ignored(tmp_path, monkeypatch):
+    data_path = write_data(tmp_path)
+    merge.load_instruction_keys(data_path, DATA)
+
+    monkeypatch.setattr(merge, "_KEYS_VERSION", merge._KEYS_VERSION + 1)
+    monkeypatch.setattr(merge, "instruction_key", lambda instruction: 7)
+    assert merge.load_instruction_keys(data_path, DATA) == [7] * len(DATA)
+
+
+def test_unwritable_sidecar_still_returns_keys(tmp_path, monkeypatch):
+    data_path = write_data(tmp_path)
+
+    def fail(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(os, "replace", fail)
+    assert merge.load_instruction_keys(data_path, DATA) == expected_keys()
+    assert sorted(os.listdir(tmp_path)) == ["data.json"]
@@ -0,0 +1,49 @@
+"""Embedding and uploading in create_qdrant_collection"""
+import asyncio
+
+from qdrant_client import QdrantClient
+
+import merge_and_create_embeddings as merge
+
+DATA = [
+    {"instruction": f"Question {i}?", "output": f"Answer {i}.", "source": "data.json",
+     "channel_username": "channel" if i % 2 else None}
+    for i in range(450)
+]
+
+
+class RecordingAsyncClient:
+    """Collects upserted batches and logs when each upsert starts"""
+
+    def __init__(self, events):
+        self.events = events
+        self.batches = []
+
+    async def upsert(self, collection_name, points):
+        self.events.append(("upsert", points.ids[0]))
+        await asyncio.sleep(0)
+        self.batches.append(points)
+
+
+def test_uploads_every_point_and_overlaps_with_embedding(fake_embedding):
+    events = []
+    client = RecordingAsyncClient(events)
+
+    asyncio.run(merge.create_qdrant_collection(
+        collection_name="test",
+        data=DATA,
+        qdrant_client=QdrantClient(":memory:"),
+        async_qdrant_client=client,
+        embedding_model=fake_embedding(delay=0.0005, events=events),
+    ))
+
+    ids = [point_id for batch in client.batches for point_id in batch.ids]
+    assert sorted(ids) == list(range(len(DATA)))
+    payloads = {point_id: payload for batch in client.batches for point_id, payload in zip(batch.ids, batch.payloads)}
+    assert payloads[3] == {"instruction": "Question 3?", "output": "Answer 3.", "source": "data.json", "channel_username": "channel"}
+    assert "channel_username" not in payloads[4]
+
+    # The first upsert must start while later batches are still being embedded
+    first_upsert = events.index(("upsert", 0))
+    last_embedded = events.index(("embedded", DATA[-1]["instruction"]))
+    assert first_upsert < last_embedded
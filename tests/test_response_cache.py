@@ -0,0 +1,43 @@
+"""Response and query-embedding caches keyed by the normalized question"""
+import asyncio
+
+from app.services.chatbot_qdrant import ChatbotService
+
+
+def test_cached_response_echoes_current_question(monkeypatch):
+    runs = []
+
+    async def run_query(self, user_question, top_k):
+        runs.append(user_question)
+        return {'answer': 'A religion.', 'context': [], 'question': user_question}
+
+    monkeypatch.setattr(ChatbotService, '_run_query', run_query)
+    service = ChatbotService()
+    service._initialized = True
+
+    async def scenario():
+        first = await service.query("What is Islam?")
+        second = await service.query("what is islam? ")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert runs == ["What is Islam?"]
+    assert first['question'] == "What is Islam?"
+    assert second['question'] == "what is islam? "
+    assert second['answer'] == first['answer']
+
+
+def test_query_embedding_cache_is_case_sensitive(fake_embedding):
+    service = ChatbotService()
+    service.embedding_model = fake_embedding()
+
+    async def scenario():
+        await service._embed_query("What is Islam?")
+        await service._embed_query("  What is Islam?\n")
+        await service._embed_query("what is islam?")
+
+    asyncio.run(scenario())
+
+    # Surrounding whitespace shares an entry; a different casing is embedded on its own
+    assert service.embedding_model.texts == ["What is Islam?", "what is islam?"]
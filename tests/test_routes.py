@@ -0,0 +1,27 @@
+"""Access control on maintenance endpoints"""
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.services import chatbot_service
+from main import app
+
+client = TestClient(app)
+
+
+def test_cache_clear_is_hidden_without_admin_token(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+    assert client.post("/cache/clear").status_code == 404
+    assert client.post("/cache/clear", headers={"X-Admin-Token": "anything"}).status_code == 404
+
+
+def test_cache_clear_requires_matching_token(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+    chatbot_service._response_cache.set(("what is islam?", 5), {"answer": "cached"})
+
+    assert client.post("/cache/clear").status_code == 403
+    assert client.post("/cache/clear", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert len(chatbot_service._response_cache) == 1
+
+    response = client.post("/cache/clear", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert len(chatbot_service._response_cache) == 0